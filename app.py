@@ -1,12 +1,42 @@
 from flask import Flask, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from pydantic import ValidationError
 from fair_calculator import FAIRCalculator
 from report_generator import generate_pdf_report
-import json
+from schemas import (BatchCalculateInput, CalculateInput, MonteCarloInput,
+                     format_validation_error)
+import orjson
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, with native NumPy serialization."""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.option), mimetype='application/json'
+        )
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
+def validation_error_response(error: ValidationError):
+    """Build the 400 response for request parameters that failed validation."""
+    return jsonify({
+        'success': False,
+        'error': format_validation_error(error)
+    }), 400
+
 @app.route('/')
 def index():
     return send_file('templates/index.html')
@@ -15,24 +45,15 @@ def index():
 def calculate_risk():
     """Calculate risk using FAIR methodology."""
     try:
-        data = request.get_json()
-        
-        # Extract input parameters
-        asset_value = float(data.get('asset_value', 0))
-        threat_event_frequency = float(data.get('threat_event_frequency', 0))
-        vulnerability = float(data.get('vulnerability', 0))
-        loss_magnitude = float(data.get('loss_magnitude', 0))
-        
-        # Validate inputs
-        if asset_value <= 0:
-            return jsonify({'error': 'Asset value must be greater than 0'}), 400
+        # Extract and validate input parameters
+        params = CalculateInput.model_validate(request.get_json(silent=True))
         
         # Initialize FAIR calculator
         calculator = FAIRCalculator(
-            asset_value=asset_value,
-            threat_event_frequency=threat_event_frequency,
-            vulnerability=vulnerability,
-            loss_magnitude=loss_magnitude
+            asset_value=params.asset_value,
+            threat_event_frequency=params.threat_event_frequency,
+            vulnerability=params.vulnerability,
+            loss_magnitude=params.loss_magnitude
         )
         
         # Calculate risk metrics
@@ -43,6 +64,37 @@ def calculate_risk():
             'results': results
         })
     
+    except ValidationError as e:
+        return validation_error_response(e)
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/calculate-batch', methods=['POST'])
+def calculate_risk_batch():
+    """Calculate risk for columns of scenarios in one vectorized pass."""
+    try:
+        params = BatchCalculateInput.model_validate(request.get_json(silent=True))
+        
+        results = FAIRCalculator.calculate_batch(
+            asset_value=params.asset_value,
+            threat_event_frequency=params.threat_event_frequency,
+            vulnerability=params.vulnerability,
+            loss_magnitude=params.loss_magnitude
+        )
+        
+        return jsonify({
+            'success': True,
+            'count': len(params.asset_value),
+            'results': results
+        })
+    
+    except ValidationError as e:
+        return validation_error_response(e)
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -53,29 +105,13 @@ def calculate_risk():
 def run_monte_carlo():
     """Run Monte Carlo simulation for risk analysis."""
     try:
-        data = request.get_json()
-        
-        asset_value = float(data.get('asset_value', 0))
-        tef_min = float(data.get('tef_min', 1))
-        tef_max = float(data.get('tef_max', 10))
-        vuln_min = float(data.get('vuln_min', 0.1))
-        vuln_max = float(data.get('vuln_max', 0.9))
-        loss_min = float(data.get('loss_min', 10000))
-        loss_max = float(data.get('loss_max', 100000))
-        iterations = int(data.get('iterations', 10000))
+        params = MonteCarloInput.model_validate(request.get_json(silent=True))
         
-        calculator = FAIRCalculator(
-            asset_value=asset_value,
-            threat_event_frequency=(tef_min + tef_max) / 2,
-            vulnerability=(vuln_min + vuln_max) / 2,
-            loss_magnitude=(loss_min + loss_max) / 2
-        )
-        
-        simulation_results = calculator.monte_carlo_simulation(
-            tef_range=(tef_min, tef_max),
-            vuln_range=(vuln_min, vuln_max),
-            loss_range=(loss_min, loss_max),
-            iterations=iterations
+        simulation_results = FAIRCalculator.monte_carlo_simulation(
+            tef_range=(params.tef_min, params.tef_max),
+            vuln_range=(params.vuln_min, params.vuln_max),
+            loss_range=(params.loss_min, params.loss_max),
+            iterations=params.iterations
         )
         
         return jsonify({
@@ -83,6 +119,9 @@ def run_monte_carlo():
             'simulation': simulation_results
         })
     
+    except ValidationError as e:
+        return validation_error_response(e)
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -95,10 +134,10 @@ def generate_report():
     try:
         data = request.get_json()
         
-        pdf_path = generate_pdf_report(data)
+        pdf_buffer = generate_pdf_report(data)
         
         return send_file(
-            pdf_path,
+            pdf_buffer,
             mimetype='application/pdf',
             as_attachment=True,
             download_name='risk_assessment_report.pdf'
@@ -1,6 +1,463 @@
+import multiprocessing
+import os
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import product
+
 import numpy as np
 from typing import Dict, Tuple
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy implementation
+    njit = None
+
+# Quantiles reported by the Monte Carlo simulation, computed in a single pass.
+# The 2.5th/97.5th quantiles bound the 95% confidence interval.
+_PERCENTILE_LABELS = ('10th', '25th', '50th', '75th', '90th', '95th', '99th')
+_QUANTILES = np.array([0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99, 0.025, 0.975])
+_MEDIAN_INDEX = 2
+
+# ALE thresholds separating the Low/Medium/High/Critical risk levels
+_RISK_THRESHOLDS = np.array([10000.0, 50000.0, 200000.0])
+_RISK_THRESHOLD_VALUES = tuple(_RISK_THRESHOLDS.tolist())
+
+# Risk level details indexed by the number of thresholds the ALE reaches
+_RISK_LEVELS = (
+    {'level': 'Low', 'color': 'green', 'priority': 'P4'},
+    {'level': 'Medium', 'color': 'yellow', 'priority': 'P3'},
+    {'level': 'High', 'color': 'orange', 'priority': 'P2'},
+    {'level': 'Critical', 'color': 'red', 'priority': 'P1'},
+)
+_RISK_LEVEL_COLUMNS = {
+    key: np.array([level[key] for level in _RISK_LEVELS])
+    for key in ('level', 'color', 'priority')
+}
+
+# Iteration count from which samples are kept in float32: dollar estimates
+# summarised by percentiles do not need float64, and halving the sample size
+# halves the memory traffic of these bandwidth-bound passes
+_FLOAT32_MIN_ITERATIONS = 1_000_000
+
+# float32 is only used while the largest possible ALE stays well inside its
+# range and is still resolved to the cent
+_FLOAT32_MAX_ALE = float(np.finfo(np.float32).max) / 2 ** 16
+_FLOAT32_MAX_SPACING = 0.01
+
+# Iteration count from which the NumPy simulation is sharded across processes
+_PARALLEL_MIN_ITERATIONS = 1_000_000
+
+# Runs above this size are streamed in fixed-size chunks through a histogram
+# sketch instead of keeping every sample for exact quantiles, so peak memory
+# no longer grows with the iteration count
+_EXACT_QUANTILE_MAX_ITERATIONS = 100_000
+_STREAM_CHUNK_ITERATIONS = 1 << 18
+_SKETCH_BINS = 1 << 16
+
+# PCG64 generator for in-process simulations; shards get spawned substreams
+_rng = np.random.default_rng()
+_seed_sequence = np.random.SeedSequence()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Per-thread sample storage, grown on demand and reused across requests.
+# Streaming caps any single request at one chunk's worth of samples.
+_buffers = threading.local()
+
+
+def _sample_dtype(iterations: int, ale_high: float) -> type:
+    """Return the sample precision for a simulation of this size and ALE bound."""
+    if (iterations >= _FLOAT32_MIN_ITERATIONS and ale_high < _FLOAT32_MAX_ALE
+            and np.spacing(np.float32(ale_high)) <= _FLOAT32_MAX_SPACING):
+        return np.float32
+    return np.float64
+
+
+def _sample_buffer(rows: int, iterations: int, dtype: type = np.float64) -> np.ndarray:
+    """Return an uninitialised, C-contiguous (rows, iterations) sample buffer."""
+    size = rows * iterations
+    storage = getattr(_buffers, 'samples', None)
+    if storage is None or storage.size < size or storage.dtype != dtype:
+        storage = np.empty(size, dtype=dtype)
+        _buffers.samples = storage
+    return storage[:size].reshape(rows, iterations)
+
+
+class _HistogramSketch:
+    """
+    Mergeable fixed-bin histogram of ALE samples over their known range.
+    
+    Quantiles are estimated by interpolating within bins, so their error is
+    bounded by one bin width (range / bins) while memory stays constant.
+    """
+    
+    def __init__(self, low: float, high: float, bins: int = _SKETCH_BINS):
+        self.low = low
+        self.high = high
+        self.counts = np.zeros(bins, dtype=np.int64)
+    
+    def update(self, samples: np.ndarray) -> None:
+        """Add a chunk of samples to the histogram."""
+        bins = len(self.counts)
+        if not (np.isfinite(self.low) and np.isfinite(self.high)):
+            raise ValueError('histogram range must be finite')
+        if self.high <= self.low:
+            self.counts[0] += samples.shape[0]
+            return
+        
+        scale = bins / (self.high - self.low)
+        if not np.isfinite(scale):
+            raise ValueError('histogram scale must be finite')
+        if _histogram_kernel is not None:
+            _histogram_kernel(samples, self.low, scale, self.counts)
+            return
+        
+        # NaN samples go to the first bin, as in the compiled kernel
+        positions = samples - self.low
+        positions *= scale
+        np.nan_to_num(positions, copy=False, nan=0.0)
+        np.clip(positions, 0, bins - 1, out=positions)
+        self.counts += np.bincount(positions.astype(np.intp), minlength=bins)
+    
+    def merge(self, other: '_HistogramSketch') -> '_HistogramSketch':
+        """Fold another sketch over the same range into this one."""
+        self.counts += other.counts
+        return self
+    
+    def quantiles(self, quantiles: np.ndarray) -> np.ndarray:
+        """Estimate quantiles, interpolating as np.quantile does on the samples."""
+        cumulative = np.cumsum(self.counts)
+        ranks = quantiles * (cumulative[-1] - 1)
+        bins = np.searchsorted(cumulative, ranks, side='right')
+        
+        # Spread each bin's samples evenly across it and locate the rank
+        before = cumulative[bins] - self.counts[bins]
+        offsets = (ranks - before + 0.5) / self.counts[bins]
+        width = (self.high - self.low) / len(self.counts)
+        return self.low + (bins + offsets) * width
+
+
+def _ale_bounds(tef_range: Tuple[float, float],
+                vuln_range: Tuple[float, float],
+                loss_range: Tuple[float, float]) -> Tuple[float, float]:
+    """Smallest and largest ALE a simulation over these ranges can produce."""
+    corners = [tef * vuln * loss
+               for tef, vuln, loss in product(tef_range, vuln_range, loss_range)]
+    return min(corners), max(corners)
+
+
+def _ale_expected(tef_range: Tuple[float, float],
+                  vuln_range: Tuple[float, float],
+                  loss_range: Tuple[float, float]) -> float:
+    """
+    Expected ALE of a simulation: the product of the range midpoints, since
+    the three factors are drawn independently.
+    
+    Sums of squares are accumulated around this value rather than zero, so
+    the variance does not cancel catastrophically for large, tight ALEs.
+    """
+    return (sum(tef_range) / 2) * (sum(vuln_range) / 2) * (sum(loss_range) / 2)
+
+
+def _fill_uniform(rng: np.random.Generator, ranges: Tuple[Tuple[float, float], ...],
+                  out: np.ndarray) -> None:
+    """Fill each row of ``out`` in place with samples from U(low, high) of its range."""
+    bounds = np.array(ranges, dtype=out.dtype)
+    rng.random(out=out, dtype=out.dtype)
+    out *= (bounds[:, 1] - bounds[:, 0])[:, np.newaxis]
+    out += bounds[:, :1]
+
+
+def _simulate_numpy(tef_range: Tuple[float, float],
+                    vuln_range: Tuple[float, float],
+                    loss_range: Tuple[float, float],
+                    iterations: int,
+                    dtype: type = np.float64,
+                    rng: np.random.Generator = _rng,
+                    shift: float = 0.0) -> Tuple:
+    """
+    Draw ALE samples with NumPy and reduce them to summary statistics.
+    
+    Returns:
+        (ale_samples, sum, sum of squares, min, max, risk level counts);
+        the sums are of deviations from ``shift``, and ale_samples may be a
+        view of this thread's reusable sample buffer
+    """
+    # Generate all random samples as one (3, N) block in the reusable buffer
+    samples = _sample_buffer(3, iterations, dtype)
+    _fill_uniform(rng, (tef_range, vuln_range, loss_range), samples)
+    tef_samples, vuln_samples, ale_samples = samples
+    
+    # Calculate ALE for each iteration (ALE = TEF × Vulnerability × Loss) in
+    # float64, in place on the loss samples when they are float64 already;
+    # float32 samples only store the products, as in the Numba kernel
+    if ale_samples.dtype == np.float64:
+        products = np.multiply(ale_samples, tef_samples, out=ale_samples)
+        spare = tef_samples
+    else:
+        products = spare = np.multiply(ale_samples, tef_samples, dtype=np.float64)
+    products *= vuln_samples
+    
+    # Extrema and risk level buckets of the float64 products
+    ale_min, ale_max = float(products.min()), float(products.max())
+    buckets = np.searchsorted(_RISK_THRESHOLDS, products, side='right')
+    counts = np.bincount(buckets, minlength=len(_RISK_THRESHOLDS) + 1)
+    if products is not ale_samples:
+        np.copyto(ale_samples, products, casting='same_kind')
+    
+    # Sum and einsum-fused sum of squares of the deviations from the shift,
+    # written over the spent TEF row (or the float64 products)
+    deviations = np.subtract(products, shift, out=spare)
+    ale_sum = deviations.sum()
+    ale_sum_sq = np.einsum('i,i->', deviations, deviations)
+    
+    return ale_samples, ale_sum, ale_sum_sq, ale_min, ale_max, counts
+
+
+if njit is not None:
+    # Numba's default workqueue threading layer aborts the process when two
+    # threads launch parallel kernels at once, which Flask's threaded server
+    # does; the kernel already uses every core, so calls are serialised
+    _kernel_lock = threading.Lock()
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _monte_carlo_kernel(tef_lo, tef_hi, vuln_lo, vuln_hi, loss_lo, loss_hi,
+                            thresholds, shift, out):
+        """
+        Fused Monte Carlo loop: draw, multiply, bucket and reduce in one pass.
+        
+        Each ALE sample is written to ``out`` (needed for the quantiles) while
+        the sums, extrema and risk level counts are accumulated per thread.
+        Sums are of deviations from ``shift``, as in :func:`_simulate_numpy`.
+        Risk levels are counted branchlessly as the number of samples reaching
+        each threshold, which keeps the loop body free of data-dependent jumps.
+        """
+        n = out.shape[0]
+        total = 0.0
+        total_sq = 0.0
+        ale_min = np.inf
+        ale_max = -np.inf
+        reach_medium = 0
+        reach_high = 0
+        reach_critical = 0
+        for i in prange(n):
+            ale = (np.random.uniform(tef_lo, tef_hi)
+                   * np.random.uniform(vuln_lo, vuln_hi)
+                   * np.random.uniform(loss_lo, loss_hi))
+            out[i] = ale
+            deviation = ale - shift
+            total += deviation
+            total_sq += deviation * deviation
+            ale_min = min(ale_min, ale)
+            ale_max = max(ale_max, ale)
+            reach_medium += ale >= thresholds[0]
+            reach_high += ale >= thresholds[1]
+            reach_critical += ale >= thresholds[2]
+        counts = np.array([n - reach_medium, reach_medium - reach_high,
+                           reach_high - reach_critical, reach_critical])
+        return total, total_sq, ale_min, ale_max, counts
+    
+    @njit(cache=True)
+    def _histogram_kernel(samples, low, scale, counts):
+        """Bin samples into ``counts`` in a single compiled pass."""
+        last = counts.shape[0] - 1
+        for value in samples:
+            position = (value - low) * scale
+            # Negated so NaN positions land in the first bin
+            if not position > 0:
+                counts[0] += 1
+            elif position >= last:
+                counts[last] += 1
+            else:
+                counts[int(position)] += 1
+    
+    def _simulate_numba(tef_range: Tuple[float, float],
+                        vuln_range: Tuple[float, float],
+                        loss_range: Tuple[float, float],
+                        iterations: int,
+                        dtype: type = np.float64,
+                        shift: float = 0.0) -> Tuple:
+        """Numba-compiled equivalent of :func:`_simulate_numpy`."""
+        ale_samples = _sample_buffer(1, iterations, dtype)[0]
+        with _kernel_lock:
+            stats = _monte_carlo_kernel(tef_range[0], tef_range[1],
+                                        vuln_range[0], vuln_range[1],
+                                        loss_range[0], loss_range[1],
+                                        _RISK_THRESHOLDS, shift, ale_samples)
+        return (ale_samples,) + stats
+else:
+    _simulate_numba = None
+    _histogram_kernel = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the process pool shared by all simulation requests."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Forked workers inherit the imported modules instead of re-importing
+            context = (multiprocessing.get_context('fork')
+                       if 'fork' in multiprocessing.get_all_start_methods() else None)
+            _executor = ProcessPoolExecutor(mp_context=context)
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next request starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _simulate_stream(simulate_chunk, tef_range: Tuple[float, float],
+                     vuln_range: Tuple[float, float],
+                     loss_range: Tuple[float, float],
+                     iterations: int) -> Tuple:
+    """
+    Run the simulation in fixed-size chunks, folding each into running totals.
+    
+    Returns:
+        (histogram sketch, sum, sum of squares, min, max, risk level counts)
+    """
+    sketch = _HistogramSketch(*_ale_bounds(tef_range, vuln_range, loss_range))
+    ale_sum = ale_sum_sq = 0.0
+    ale_min, ale_max = np.inf, -np.inf
+    counts = np.zeros(len(_RISK_LEVELS), dtype=np.int64)
+    
+    for start in range(0, iterations, _STREAM_CHUNK_ITERATIONS):
+        chunk = min(_STREAM_CHUNK_ITERATIONS, iterations - start)
+        samples, chunk_sum, chunk_sum_sq, chunk_min, chunk_max, chunk_counts = (
+            simulate_chunk(tef_range, vuln_range, loss_range, chunk)
+        )
+        sketch.update(samples)
+        ale_sum += chunk_sum
+        ale_sum_sq += chunk_sum_sq
+        ale_min = min(ale_min, chunk_min)
+        ale_max = max(ale_max, chunk_max)
+        counts += chunk_counts
+    
+    return sketch, ale_sum, ale_sum_sq, ale_min, ale_max, counts
+
+
+def _simulate_shard(tef_range: Tuple[float, float],
+                    vuln_range: Tuple[float, float],
+                    loss_range: Tuple[float, float],
+                    iterations: int, dtype: type, shift: float,
+                    seed: np.random.SeedSequence) -> Tuple:
+    """Worker entry point: stream one shard of the simulation on its own RNG stream."""
+    # Forked workers inherit a copy of the parent's generator, so each shard
+    # draws from an independent substream instead
+    rng = np.random.default_rng(seed)
+    simulate_chunk = partial(_simulate_numpy, dtype=dtype, rng=rng, shift=shift)
+    return _simulate_stream(simulate_chunk, tef_range, vuln_range, loss_range,
+                            iterations)
+
+
+def _simulate_parallel(tef_range: Tuple[float, float],
+                       vuln_range: Tuple[float, float],
+                       loss_range: Tuple[float, float],
+                       iterations: int, dtype: type, shift: float,
+                       shards: int) -> Tuple:
+    """
+    Split the simulation across worker processes and merge partial statistics.
+    """
+    base, extra = divmod(iterations, shards)
+    seeds = _seed_sequence.spawn(shards)
+    executor = _get_executor()
+    try:
+        futures = [
+            executor.submit(_simulate_shard, tef_range, vuln_range, loss_range,
+                            base + (i < extra), dtype, shift, seeds[i])
+            for i in range(shards)
+        ]
+        parts = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died; the pool cannot run anything else, so replace it
+        _discard_executor(executor)
+        raise
+    
+    sketch = parts[0][0]
+    for part in parts[1:]:
+        sketch.merge(part[0])
+    return (sketch,
+            sum(part[1] for part in parts),
+            sum(part[2] for part in parts),
+            min(part[3] for part in parts),
+            max(part[4] for part in parts),
+            sum(part[5] for part in parts))
+
+
+def _select_quantiles(ale_samples: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolated quantiles (as np.quantile) from one partition pass.
+    
+    Only the order statistics either side of each quantile are placed, so
+    ``ale_samples`` is partitioned in place instead of being sorted.
+    """
+    last = ale_samples.shape[0] - 1
+    positions = _QUANTILES * last
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, last)
+    ale_samples.partition(np.union1d(lower, upper))
+    
+    below = ale_samples[lower].astype(np.float64)
+    above = ale_samples[upper].astype(np.float64)
+    return below + (above - below) * (positions - lower)
+
+
+def _simulate(tef_range: Tuple[float, float],
+              vuln_range: Tuple[float, float],
+              loss_range: Tuple[float, float],
+              iterations: int) -> Tuple:
+    """
+    Run the simulation on the fastest available backend.
+    
+    Returns:
+        (quantiles, mean, standard deviation, min, max, risk level counts)
+    """
+    ale_high = _ale_bounds(tef_range, vuln_range, loss_range)[1]
+    dtype = _sample_dtype(iterations, ale_high)
+    shift = _ale_expected(tef_range, vuln_range, loss_range)
+    if _simulate_numba is not None:
+        # The compiled kernel already runs on every core through prange
+        simulate_chunk = partial(_simulate_numba, dtype=dtype, shift=shift)
+    else:
+        simulate_chunk = partial(_simulate_numpy, dtype=dtype, shift=shift)
+    
+    shards = os.cpu_count() or 1
+    if iterations <= _EXACT_QUANTILE_MAX_ITERATIONS:
+        ale_samples, ale_sum, ale_sum_sq, *extrema = simulate_chunk(
+            tef_range, vuln_range, loss_range, iterations
+        )
+        quantiles = _select_quantiles(ale_samples)
+    else:
+        sketch = None
+        if _simulate_numba is None and shards > 1 and iterations >= _PARALLEL_MIN_ITERATIONS:
+            try:
+                sketch, ale_sum, ale_sum_sq, *extrema = _simulate_parallel(
+                    tef_range, vuln_range, loss_range, iterations, dtype, shift,
+                    shards
+                )
+            except BrokenProcessPool:
+                pass  # Fall back to streaming the run in this process
+        if sketch is None:
+            sketch, ale_sum, ale_sum_sq, *extrema = _simulate_stream(
+                simulate_chunk, tef_range, vuln_range, loss_range, iterations
+            )
+        quantiles = sketch.quantiles(_QUANTILES)
+    
+    # Moments of the deviations from the shift, moved back to the ALE scale
+    mean_deviation = ale_sum / iterations
+    variance = max(ale_sum_sq / iterations - mean_deviation * mean_deviation, 0.0)
+    return (quantiles, shift + mean_deviation, np.sqrt(variance), *extrema)
+
+
 class FAIRCalculator:
     """
     FAIR (Factor Analysis of Information Risk) Calculator
@@ -8,6 +465,9 @@ class FAIRCalculator:
     Calculates cybersecurity risk in dollar amounts using the FAIR framework.
     """
     
+    __slots__ = ('asset_value', 'threat_event_frequency', 'vulnerability',
+                 'loss_magnitude')
+    
     def __init__(self, asset_value: float, threat_event_frequency: float, 
                  vulnerability: float, loss_magnitude: float):
         """
@@ -24,27 +484,36 @@ class FAIRCalculator:
         self.vulnerability = vulnerability
         self.loss_magnitude = loss_magnitude
     
+    def _compute(self) -> Tuple[float, float, float]:
+        """
+        Compute LEF, ALE and SLE together from the current parameters.
+        
+        Returns:
+            (loss event frequency, annual loss expectancy, single loss expectancy)
+        """
+        lef = self.threat_event_frequency * self.vulnerability
+        return lef, lef * self.loss_magnitude, self.loss_magnitude
+    
     def calculate_loss_event_frequency(self) -> float:
         """
         Calculate Loss Event Frequency (LEF)
         LEF = Threat Event Frequency (TEF) × Vulnerability
         """
-        return self.threat_event_frequency * self.vulnerability
+        return self._compute()[0]
     
     def calculate_annual_loss_expectancy(self) -> float:
         """
         Calculate Annual Loss Expectancy (ALE)
         ALE = Loss Event Frequency × Loss Magnitude
         """
-        lef = self.calculate_loss_event_frequency()
-        return lef * self.loss_magnitude
+        return self._compute()[1]
     
     def calculate_single_loss_expectancy(self) -> float:
         """
         Calculate Single Loss Expectancy (SLE)
         SLE = Asset Value × Exposure Factor
         """
-        return self.loss_magnitude
+        return self._compute()[2]
     
     def calculate_risk_level(self, ale: float) -> Dict[str, str]:
         """
@@ -53,14 +522,9 @@ class FAIRCalculator:
         Returns:
             Dict with risk level and color coding
         """
-        if ale < 10000:
-            return {'level': 'Low', 'color': 'green', 'priority': 'P4'}
-        elif ale < 50000:
-            return {'level': 'Medium', 'color': 'yellow', 'priority': 'P3'}
-        elif ale < 200000:
-            return {'level': 'High', 'color': 'orange', 'priority': 'P2'}
-        else:
-            return {'level': 'Critical', 'color': 'red', 'priority': 'P1'}
+        # Same bucketing as the Monte Carlo distribution; bisect rather than
+        # np.searchsorted since NumPy call overhead dominates for one scalar
+        return dict(_RISK_LEVELS[bisect_right(_RISK_THRESHOLD_VALUES, ale)])
     
     def calculate(self) -> Dict:
         """
@@ -69,9 +533,7 @@ class FAIRCalculator:
         Returns:
             Dictionary with all calculated risk metrics
         """
-        lef = self.calculate_loss_event_frequency()
-        ale = self.calculate_annual_loss_expectancy()
-        sle = self.calculate_single_loss_expectancy()
+        lef, ale, sle = self._compute()
         risk_level = self.calculate_risk_level(ale)
         
         # Calculate risk exposure as percentage of asset value
@@ -91,7 +553,53 @@ class FAIRCalculator:
             'risk_exposure_percentage': round(risk_exposure_pct, 2)
         }
     
-    def monte_carlo_simulation(self, tef_range: Tuple[float, float], 
+    @staticmethod
+    def calculate_batch(asset_value, threat_event_frequency, vulnerability,
+                        loss_magnitude) -> Dict:
+        """
+        Perform the FAIR risk calculation for many scenarios at once.
+        
+        Args:
+            asset_value: Asset values ($), one per scenario
+            threat_event_frequency: Expected threat events per year
+            vulnerability: Probabilities of successful attack (0-1)
+            loss_magnitude: Expected losses per incident ($)
+        
+        Each argument is a 1-D array or a scalar shared by all scenarios.
+        
+        Returns:
+            Dictionary with the same keys as calculate(); numeric metrics are
+            arrays and risk level fields are lists of strings
+        """
+        asset_value, tef, vuln, loss = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in
+              (asset_value, threat_event_frequency, vulnerability, loss_magnitude))
+        )
+        lef = tef * vuln
+        ale = lef * loss
+        levels = np.searchsorted(_RISK_THRESHOLDS, ale, side='right')
+        
+        # Calculate risk exposure as percentage of asset value
+        risk_exposure_pct = np.divide(ale, asset_value, out=np.zeros_like(ale),
+                                      where=asset_value > 0)
+        risk_exposure_pct *= 100
+        
+        return {
+            'asset_value': np.round(asset_value, 2),
+            'threat_event_frequency': np.round(tef, 2),
+            'vulnerability': np.round(vuln, 3),
+            'loss_magnitude': np.round(loss, 2),
+            'loss_event_frequency': np.round(lef, 3),
+            'single_loss_expectancy': np.round(loss, 2),
+            'annual_loss_expectancy': np.round(ale, 2),
+            'risk_level': _RISK_LEVEL_COLUMNS['level'][levels].tolist(),
+            'risk_color': _RISK_LEVEL_COLUMNS['color'][levels].tolist(),
+            'risk_priority': _RISK_LEVEL_COLUMNS['priority'][levels].tolist(),
+            'risk_exposure_percentage': np.round(risk_exposure_pct, 2)
+        }
+    
+    @staticmethod
+    def monte_carlo_simulation(tef_range: Tuple[float, float],
                                vuln_range: Tuple[float, float],
                                loss_range: Tuple[float, float],
                                iterations: int = 10000) -> Dict:
@@ -107,55 +615,39 @@ class FAIRCalculator:
         Returns:
             Dictionary with simulation results and statistics
         """
-        # Generate random samples
-        tef_samples = np.random.uniform(tef_range[0], tef_range[1], iterations)
-        vuln_samples = np.random.uniform(vuln_range[0], vuln_range[1], iterations)
-        loss_samples = np.random.uniform(loss_range[0], loss_range[1], iterations)
-        
-        # Calculate ALE for each iteration
-        lef_samples = tef_samples * vuln_samples
-        ale_samples = lef_samples * loss_samples
-        
-        # Calculate statistics
-        ale_mean = np.mean(ale_samples)
-        ale_median = np.median(ale_samples)
-        ale_std = np.std(ale_samples)
-        ale_min = np.min(ale_samples)
-        ale_max = np.max(ale_samples)
-        
-        # Calculate percentiles
-        percentiles = {
-            '10th': np.percentile(ale_samples, 10),
-            '25th': np.percentile(ale_samples, 25),
-            '50th': np.percentile(ale_samples, 50),
-            '75th': np.percentile(ale_samples, 75),
-            '90th': np.percentile(ale_samples, 90),
-            '95th': np.percentile(ale_samples, 95),
-            '99th': np.percentile(ale_samples, 99)
-        }
+        quantiles, ale_mean, ale_std, ale_min, ale_max, counts = _simulate(
+            tef_range, vuln_range, loss_range, iterations
+        )
+        
+        # Round all percentiles (and the 95% confidence bounds) at once
+        quantiles = np.round(quantiles, 2).tolist()
+        percentiles = dict(zip(_PERCENTILE_LABELS, quantiles))
+        ci_lower, ci_upper = quantiles[-2:]
+        
+        # Round the remaining statistics in one vectorised call
+        ale_mean, ale_std, ale_min, ale_max = np.round(
+            [ale_mean, ale_std, ale_min, ale_max], 2
+        ).tolist()
         
-        # Calculate risk level distribution
-        low = np.sum(ale_samples < 10000)
-        medium = np.sum((ale_samples >= 10000) & (ale_samples < 50000))
-        high = np.sum((ale_samples >= 50000) & (ale_samples < 200000))
-        critical = np.sum(ale_samples >= 200000)
+        # Risk level distribution
+        low, medium, high, critical = counts.tolist()
         
         return {
             'iterations': iterations,
-            'mean_ale': round(ale_mean, 2),
-            'median_ale': round(ale_median, 2),
-            'std_dev': round(ale_std, 2),
-            'min_ale': round(ale_min, 2),
-            'max_ale': round(ale_max, 2),
-            'percentiles': {k: round(v, 2) for k, v in percentiles.items()},
+            'mean_ale': ale_mean,
+            'median_ale': quantiles[_MEDIAN_INDEX],
+            'std_dev': ale_std,
+            'min_ale': ale_min,
+            'max_ale': ale_max,
+            'percentiles': percentiles,
             'risk_distribution': {
-                'low': int(low),
-                'medium': int(medium),
-                'high': int(high),
-                'critical': int(critical)
+                'low': low,
+                'medium': medium,
+                'high': high,
+                'critical': critical
             },
             'confidence_95': {
-                'lower': round(np.percentile(ale_samples, 2.5), 2),
-                'upper': round(np.percentile(ale_samples, 97.5), 2)
+                'lower': ci_lower,
+                'upper': ci_upper
             }
         }
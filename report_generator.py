@@ -4,9 +4,66 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
 from datetime import datetime
-import os
+from io import BytesIO
 
-def generate_pdf_report(data: dict) -> str:
+# Styles are immutable for our purposes, so build them once at import
+_STYLES = getSampleStyleSheet()
+_TITLE_COLOR = colors.HexColor('#1a1a1a')
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=_TITLE_COLOR,
+    spaceAfter=30,
+    alignment=1  # Center
+)
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+# Display format and fallback for every result value shown in the report
+_RESULT_FORMATS = {
+    'asset_value': ('${:,.2f}', 0),
+    'threat_event_frequency': ('{}', 0),
+    'vulnerability': ('{:.2%}', 0),
+    'loss_magnitude': ('${:,.2f}', 0),
+    'loss_event_frequency': ('{}', 0),
+    'single_loss_expectancy': ('${:,.2f}', 0),
+    'annual_loss_expectancy': ('${:,.2f}', 0),
+    'risk_level': ('{}', 'Unknown'),
+    'risk_priority': ('{}', 'N/A'),
+    'risk_exposure_percentage': ('{:.2f}%', 0),
+}
+
+# (row label, result key) for the parameters and results tables
+_PARAMS_ROWS = (
+    ('Asset Value', 'asset_value'),
+    ('Threat Event Frequency (per year)', 'threat_event_frequency'),
+    ('Vulnerability (probability)', 'vulnerability'),
+    ('Loss Magnitude (per event)', 'loss_magnitude'),
+)
+_RESULTS_ROWS = (
+    ('Loss Event Frequency (per year)', 'loss_event_frequency'),
+    ('Single Loss Expectancy', 'single_loss_expectancy'),
+    ('Annual Loss Expectancy', 'annual_loss_expectancy'),
+    ('Risk Level', 'risk_level'),
+    ('Risk Priority', 'risk_priority'),
+    ('Risk Exposure (% of asset value)', 'risk_exposure_percentage'),
+)
+
+_SUMMARY_TEMPLATE = (
+    "This risk assessment quantifies cybersecurity risk using the FAIR (Factor Analysis of Information Risk) methodology. "
+    "The analysis estimates an <b>Annual Loss Expectancy (ALE) of {annual_loss_expectancy}</b> "
+    "with a risk level of <b>{risk_level}</b>."
+).format
+
+def generate_pdf_report(data: dict) -> BytesIO:
     """
     Generate PDF risk assessment report.
     
@@ -14,72 +71,56 @@ def generate_pdf_report(data: dict) -> str:
         data: Dictionary containing risk assessment results
     
     Returns:
-        Path to generated PDF file
+        In-memory buffer holding the PDF, positioned at the start
     """
-    # Create output directory if it doesn't exist
-    os.makedirs('reports', exist_ok=True)
-    
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f'reports/risk_assessment_{timestamp}.pdf'
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(filename, pagesize=letter)
+    # Create PDF document in memory
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
     elements = []
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    
-    elements.append(Paragraph("Cybersecurity Risk Assessment Report", title_style))
+    elements.append(Paragraph("Cybersecurity Risk Assessment Report", _TITLE_STYLE))
     elements.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", styles['Normal']))
     elements.append(Spacer(1, 0.3*inch))
     
     # Executive Summary
     elements.append(Paragraph("Executive Summary", styles['Heading2']))
     
+    # Format every displayed value once; the summary and tables share them
     results = data.get('results', {})
-    ale = results.get('annual_loss_expectancy', 0)
-    risk_level = results.get('risk_level', 'Unknown')
+    values = {
+        key: fmt.format(results.get(key, default))
+        for key, (fmt, default) in _RESULT_FORMATS.items()
+    }
     
-    summary_text = f"""
-    This risk assessment quantifies cybersecurity risk using the FAIR (Factor Analysis of Information Risk) methodology.
-    The analysis estimates an <b>Annual Loss Expectancy (ALE) of ${ale:,.2f}</b> with a risk level of <b>{risk_level}</b>.
-    """
-    
-    elements.append(Paragraph(summary_text, styles['BodyText']))
+    elements.append(Paragraph(_SUMMARY_TEMPLATE(**values), styles['BodyText']))
     elements.append(Spacer(1, 0.2*inch))
     
     # Risk Parameters Table
     elements.append(Paragraph("Risk Assessment Parameters", styles['Heading2']))
     
-    params_data = [
-        ['Parameter', 'Value'],
-        ['Asset Value', f"${results.get('asset_value', 0):,.2f}"],
-        ['Threat Event Frequency (per year)', results.get('threat_event_frequency', 0)],
-        ['Vulnerability (probability)', f"{results.get('vulnerability', 0):.2%}"],
-        ['Loss Magnitude (per event)', f"${results.get('loss_magnitude', 0):,.2f}"]
-    ]
+    params_data = [['Parameter', 'Value']]
+    params_data += [[label, values[key]] for label, key in _PARAMS_ROWS]
     
     params_table = Table(params_data, colWidths=[3*inch, 2*inch])
-    params_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    params_table.setStyle(_TABLE_STYLE)
     
     elements.append(params_table)
     elements.append(Spacer(1, 0.3*inch))
     
     # Risk Calculation Results
-    elements.append(Paragraph("Risk Calculation Results", styles
+    elements.append(Paragraph("Risk Calculation Results", styles['Heading2']))
+    
+    results_data = [['Metric', 'Value']]
+    results_data += [[label, values[key]] for label, key in _RESULTS_ROWS]
+    
+    results_table = Table(results_data, colWidths=[3*inch, 2*inch])
+    results_table.setStyle(_TABLE_STYLE)
+    
+    elements.append(results_table)
+    
+    doc.build(elements)
+    buffer.seek(0)
+    
+    return buffer
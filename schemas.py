@@ -0,0 +1,103 @@
+import math
+from typing import List
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+# Upper bound on simulation size accepted from API clients
+MAX_ITERATIONS = 100_000_000
+
+# Upper bound on the number of scenarios in one batch calculation
+MAX_BATCH_SCENARIOS = 100_000
+
+class CalculateInput(BaseModel):
+    """
+    Input parameters for a single FAIR risk calculation.
+    """
+
+    # Reject "inf"/"nan" before they reach the calculator
+    model_config = ConfigDict(allow_inf_nan=False)
+
+    asset_value: float = Field(0.0, gt=0, validate_default=True)
+    threat_event_frequency: float = Field(0.0, ge=0)
+    vulnerability: float = Field(0.0, ge=0, le=1)
+    loss_magnitude: float = Field(0.0, ge=0)
+
+# (lower bound, whether the bound is inclusive, upper bound) per batch column,
+# matching the per-field constraints of CalculateInput
+_BATCH_LIMITS = {
+    'asset_value': (0.0, False, None),
+    'threat_event_frequency': (0.0, True, None),
+    'vulnerability': (0.0, True, 1.0),
+    'loss_magnitude': (0.0, True, None),
+}
+
+class BatchCalculateInput(BaseModel):
+    """
+    Column-wise parameters for a FAIR batch calculation, one entry per scenario.
+
+    Columns are parsed as flat float lists and range-checked with NumPy
+    rather than validated as one model per scenario.
+    """
+
+    model_config = ConfigDict(allow_inf_nan=False)
+
+    asset_value: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)
+    threat_event_frequency: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)
+    vulnerability: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)
+    loss_magnitude: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)
+
+    @model_validator(mode='after')
+    def check_columns(self) -> 'BatchCalculateInput':
+        """Ensure the columns line up and every value is in range."""
+        if len({len(getattr(self, name)) for name in _BATCH_LIMITS}) > 1:
+            raise ValueError('all columns must have the same number of scenarios')
+
+        for name, (low, inclusive, high) in _BATCH_LIMITS.items():
+            values = np.asarray(getattr(self, name))
+            invalid = values < low if inclusive else values <= low
+            if high is not None:
+                invalid |= values > high
+            if invalid.any():
+                index = int(np.argmax(invalid))
+                bound = f'{low}' if high is None else f'[{low}, {high}]'
+                relation = 'in' if high is not None else ('>=' if inclusive else '>')
+                raise ValueError(f'{name}[{index}] must be {relation} {bound}')
+        return self
+
+class MonteCarloInput(BaseModel):
+    """
+    Input ranges for a Monte Carlo risk simulation.
+    """
+
+    # Reject "inf"/"nan" before they reach the simulation kernels
+    model_config = ConfigDict(allow_inf_nan=False)
+
+    asset_value: float = Field(0.0, ge=0)
+    tef_min: float = Field(1.0, ge=0)
+    tef_max: float = Field(10.0, ge=0)
+    vuln_min: float = Field(0.1, ge=0, le=1)
+    vuln_max: float = Field(0.9, ge=0, le=1)
+    loss_min: float = Field(10000.0, ge=0)
+    loss_max: float = Field(100000.0, ge=0)
+    iterations: int = Field(10000, gt=0, le=MAX_ITERATIONS)
+
+    @model_validator(mode='after')
+    def check_ranges(self) -> 'MonteCarloInput':
+        """Ensure every (min, max) range is ordered and the ALE stays finite."""
+        for name in ('tef', 'vuln', 'loss'):
+            if getattr(self, f'{name}_min') > getattr(self, f'{name}_max'):
+                raise ValueError(f'{name}_min must not exceed {name}_max')
+        if not math.isfinite(self.tef_max * self.vuln_max * self.loss_max):
+            raise ValueError('tef_max * vuln_max * loss_max must be a finite number')
+        return self
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    Flatten a pydantic ValidationError into a single readable message.
+    """
+    messages = []
+    for detail in error.errors(include_url=False):
+        field = '.'.join(str(part) for part in detail['loc'])
+        messages.append(f"{field}: {detail['msg']}" if field else detail['msg'])
+    return '; '.join(messages)